@@ -7,24 +7,48 @@ API documentation with request/response models for each endpoint.
 
 Usage:
     python generate_api_docs.py [--output api_docs.json] [--format json|md|both]
+                                [--no-search-index] [--benchmark-search] [--audit-data-access]
+                                [--compress] [--frontend-callers [--jobs N]]
+                                [--build-schema-snapshot]
 """
 
 import os
 import re
+import gzip
 import json
+import mmap
+import time
+import base64
+import bisect
+import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
 from typing import Optional
 from pathlib import Path
 from enum import Enum
 
+try:
+    import brotli
+except ImportError:  # Optional: only needed for .br artifacts
+    brotli = None
+
 # Configuration
 CONTROLLERS_PATH = Path(__file__).parent.parent / "back/src/SurveyApp.API/Controllers"
 FEATURES_PATH = Path(__file__).parent.parent / "back/src/SurveyApp.Application/Features"
 DTOS_PATH = Path(__file__).parent.parent / "back/src/SurveyApp.Application/DTOs"
+REPOSITORIES_PATH = Path(__file__).parent.parent / "back/src/SurveyApp.Infrastructure/Repositories"
+SPECIFICATIONS_PATH = Path(__file__).parent.parent / "back/src/SurveyApp.Domain/Specifications"
+FRONTEND_PATH = Path(__file__).parent.parent / "front"
 OUTPUT_PATH = Path(__file__).parent.parent / "API_DOCUMENTATION"
 
 
+UTF8_BOM = b"\xef\xbb\xbf"
+
+# Files memory-mapped vs. decoded (fully or partially) while scanning sources
+SCAN_STATS = {"mapped": 0, "decoded": 0, "decoded_bytes": 0}
+
+
 class HttpMethod(Enum):
     GET = "GET"
     POST = "POST"
@@ -62,6 +86,17 @@ class Endpoint:
     parameters: list = field(default_factory=list)
     responses: list = field(default_factory=list)
     controller: str = ""
+    request_type: Optional[str] = None
+    handler: Optional[str] = None
+    callers: Optional[list] = None
+
+
+@dataclass
+class DataAccessFinding:
+    kind: str  # "query_in_loop", "unbounded_list", "missing_no_tracking", "include_chain"
+    location: str
+    detail: str
+    weight: int
 
 
 @dataclass
@@ -72,16 +107,104 @@ class Controller:
     endpoints: list = field(default_factory=list)
 
 
-def parse_controller_file(file_path: Path) -> Optional[Controller]:
-    """Parse a single controller file and extract endpoint information."""
+# =============================================================================
+# Source Scanning
+# =============================================================================
+
+def map_source(file_path: Path):
+    """Memory-map a source file read-only; empty files map to b"". Returns None on error."""
     try:
-        content = file_path.read_text(encoding='utf-8')
-    except Exception as e:
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            SCAN_STATS["mapped"] += 1
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError as e:
         print(f"Error reading {file_path}: {e}")
         return None
 
+
+def decode_source(data, file_path: Path, end: Optional[int] = None) -> Optional[str]:
+    """Decode data[:end] as UTF-8 (BOM stripped), reporting rather than hiding bad encodings."""
+    start = len(UTF8_BOM) if data[:len(UTF8_BOM)] == UTF8_BOM else 0
+    chunk = data[start:end]
+    try:
+        text = chunk.decode("utf-8") if isinstance(chunk, bytes) else bytes(chunk).decode("utf-8")
+    except UnicodeDecodeError as e:
+        line = data[:start + e.start].count(b"\n") + 1
+        print(f"Error decoding {file_path}: invalid UTF-8 at byte {start + e.start} (line {line}): {e.reason}")
+        return None
+    SCAN_STATS["decoded"] += 1
+    SCAN_STATS["decoded_bytes"] += len(chunk)
+    return text
+
+
+def read_source(file_path: Path, marker: Optional[bytes] = None) -> Optional[str]:
+    """
+    Read a whole source file. When marker is given, the file is memory-mapped and only
+    decoded if the marker bytes occur in it; otherwise None is returned without decoding.
+    """
+    data = map_source(file_path)
+    if data is None:
+        return None
+    try:
+        if marker is not None and data.find(marker) == -1:
+            return None
+        return decode_source(data, file_path)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+BRACE_PATTERN = re.compile(rb"[{}]")
+
+
+def find_block_end(data, open_index: int) -> int:
+    """Byte offset just past the brace matching the one at open_index (braces are ASCII in UTF-8)."""
+    brace_count = 0
+    for match in BRACE_PATTERN.finditer(data, open_index):
+        brace_count += 1 if match.group() == b"{" else -1
+        if brace_count == 0:
+            return match.end()
+    return len(data)
+
+
+def read_type_source(file_path: Path, type_name: str) -> Optional[str]:
+    """
+    Memory-map file_path and return its text up to the end of the class/record named
+    type_name, or None if the file does not declare it. Files without the type are
+    never decoded.
+    """
+    data = map_source(file_path)
+    if not data:
+        return None
+    try:
+        name = type_name.encode("ascii")
+        if data.find(b"class " + name) == -1 and data.find(b"record " + name) == -1:
+            return None
+        match = re.search(rb"(?:class|record)\s+" + re.escape(name) + rb"\b[^{;]*[{;]", data)
+        if match is None:
+            # The quick check also hits longer names, e.g. UpdateSurveyCommandHandler
+            return None
+        if data[match.end() - 1:match.end()] == b";":
+            end = match.end()
+        else:
+            end = find_block_end(data, match.end() - 1)
+        return decode_source(data, file_path, end)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def parse_controller_file(file_path: Path) -> Optional[Controller]:
+    """Parse a single controller file and extract endpoint information."""
     controller_name = file_path.stem.replace("Controller", "")
     
+    # Controllers without any [Http...] attribute have no endpoints; skip decoding them
+    content = read_source(file_path, marker=b"[Http")
+    if content is None:
+        return None
+    
     # Extract base route
     route_match = re.search(r'\[Route\("([^"]+)"\)\]', content)
     base_route = route_match.group(1) if route_match else f"api/{controller_name.lower()}"
@@ -112,8 +235,10 @@ def parse_controller_file(file_path: Path) -> Optional[Controller]:
         attributes = match.group('attributes')
         method_name = match.group('method_name')
         params = match.group('params')
+        body_start = content.find('{', match.end())
+        body = extract_block(content, body_start) if body_start != -1 else ""
         
-        endpoint = parse_endpoint(attributes, method_name, params, base_route, class_requires_auth)
+        endpoint = parse_endpoint(attributes, method_name, params, base_route, class_requires_auth, body)
         if endpoint:
             endpoint.controller = controller_name
             controller.endpoints.append(endpoint)
@@ -121,7 +246,7 @@ def parse_controller_file(file_path: Path) -> Optional[Controller]:
     return controller
 
 
-def parse_endpoint(attributes: str, method_name: str, params: str, base_route: str, class_auth: bool) -> Optional[Endpoint]:
+def parse_endpoint(attributes: str, method_name: str, params: str, base_route: str, class_auth: bool, body: str = "") -> Optional[Endpoint]:
     """Parse endpoint attributes and parameters."""
     
     # Determine HTTP method
@@ -193,14 +318,14 @@ def parse_endpoint(attributes: str, method_name: str, params: str, base_route: s
             
             # Check for [FromBody]
             if "[FromBody]" in param:
-                body_match = re.search(r'\[FromBody\]\s*(\w+(?:<[^>]+>)?)\s*(\w+)', param)
+                body_match = re.search(r'\[FromBody\]\s*(\w+(?:<[^>]+>)?)\??\s*(\w+)', param)
                 if body_match:
                     request_model = body_match.group(1)
                     request_properties = get_model_properties(request_model)
             
             # Check for [FromQuery]
             elif "[FromQuery]" in param:
-                query_match = re.search(r'\[FromQuery\]\s*(\w+(?:<[^>]+>)?)\s*(\w+)', param)
+                query_match = re.search(r'\[FromQuery\]\s*(\w+(?:<[^>]+>)?)\??\s*(\w+)', param)
                 if query_match:
                     param_type = query_match.group(1)
                     param_name = query_match.group(2)
@@ -243,10 +368,49 @@ def parse_endpoint(attributes: str, method_name: str, params: str, base_route: s
         request_model=request_model,
         request_properties=request_properties,
         parameters=parameters,
-        responses=responses
+        responses=responses,
+        request_type=find_mediator_request(body, params)
     )
 
 
+def find_mediator_request(body: str, params: str) -> Optional[str]:
+    """Find the MediatR request type an action sends, e.g. _mediator.Send(new GetSurveyByIdQuery(id))."""
+    send_match = re.search(r'\.Send\(\s*\(?\s*(?:new\s+(\w+)|(\w+))', body)
+    if not send_match:
+        return None
+    if send_match.group(1):
+        return send_match.group(1)
+    
+    # Resolve the sent variable through its declaration, following `var x = y with { ... }`
+    variable = send_match.group(2)
+    for _ in range(3):
+        for source in (params, body):
+            decl_match = re.search(rf'(\w+)(?:<[^>]+>)?\??\s+{variable}\b', source)
+            if decl_match and decl_match.group(1) not in ("var", "new", "await", "return"):
+                return decl_match.group(1)
+        assign_match = re.search(rf'\bvar\s+{variable}\s*=\s*(?:new\s+(\w+)|(\w+)\s+with\b)', body)
+        if not assign_match:
+            return None
+        if assign_match.group(1):
+            return assign_match.group(1)
+        variable = assign_match.group(2)
+    return None
+
+
+def extract_block(content: str, open_index: int) -> str:
+    """Return the text between the brace at open_index and its matching closing brace."""
+    brace_count = 0
+    for i in range(open_index, len(content)):
+        char = content[i]
+        if char == '{':
+            brace_count += 1
+        elif char == '}':
+            brace_count -= 1
+            if brace_count == 0:
+                return content[open_index + 1:i]
+    return content[open_index + 1:]
+
+
 def split_params(params: str) -> list:
     """Split parameter string handling nested generics."""
     result = []
@@ -272,219 +436,203 @@ def split_params(params: str) -> list:
 
 def get_model_properties(model_name: str) -> dict:
     """
-    Get properties of a model by searching through Features and DTOs.
+    Get properties of a model, from the schema snapshot when its source file is
+    unchanged, otherwise by searching through Features and DTOs.
     Returns a dict of property_name: property_type
     """
-    properties = {}
+    if not model_name:
+        return {}
     
-    # Common model property mappings (fallback/known models)
-    known_models = {
-        "LoginCommand": {
-            "Email": "string",
-            "Password": "string"
-        },
-        "RegisterCommand": {
-            "Email": "string",
-            "Password": "string",
-            "FirstName": "string",
-            "LastName": "string"
-        },
-        "RefreshTokenCommand": {
-            "RefreshToken": "string"
-        },
-        "ForgotPasswordCommand": {
-            "Email": "string"
-        },
-        "ResetPasswordCommand": {
-            "Email": "string",
-            "Token": "string",
-            "NewPassword": "string"
-        },
-        "CreateSurveyCommand": {
-            "Title": "string",
-            "Description": "string?",
-            "Type": "SurveyType",
-            "CxMetricType": "CxMetricType?",
-            "WelcomeMessage": "string?",
-            "ThankYouMessage": "string?",
-            "AllowAnonymousResponses": "bool",
-            "AllowMultipleResponses": "bool",
-            "StartsAt": "DateTime?",
-            "EndsAt": "DateTime?",
-            "MaxResponses": "int?",
-            "DefaultLanguage": "string?"
-        },
-        "UpdateSurveyCommand": {
-            "SurveyId": "Guid",
-            "Title": "string?",
-            "Description": "string?",
-            "WelcomeMessage": "string?",
-            "ThankYouMessage": "string?",
-            "AllowAnonymousResponses": "bool?",
-            "AllowMultipleResponses": "bool?",
-            "StartsAt": "DateTime?",
-            "EndsAt": "DateTime?",
-            "MaxResponses": "int?",
-            "ThemeId": "Guid?",
-            "PresetThemeId": "string?",
-            "DefaultLanguage": "string?"
-        },
-        "DuplicateSurveyCommand": {
-            "SurveyId": "Guid",
-            "NewTitle": "string?"
-        },
-        "CreateQuestionCommand": {
-            "SurveyId": "Guid",
-            "Text": "string",
-            "Type": "QuestionType",
-            "Description": "string?",
-            "IsRequired": "bool",
-            "Order": "int?",
-            "Options": "List<QuestionOptionDto>?",
-            "Settings": "QuestionSettingsDto?"
-        },
-        "UpdateQuestionCommand": {
-            "SurveyId": "Guid",
-            "QuestionId": "Guid",
-            "Text": "string?",
-            "Description": "string?",
-            "IsRequired": "bool?",
-            "Order": "int?",
-            "Options": "List<QuestionOptionDto>?",
-            "Settings": "QuestionSettingsDto?"
-        },
-        "ReorderQuestionsCommand": {
-            "SurveyId": "Guid",
-            "QuestionIds": "List<Guid>"
-        },
-        "StartResponseCommand": {
-            "SurveyId": "Guid?",
-            "ShareToken": "string?",
-            "RespondentEmail": "string?",
-            "Language": "string?"
-        },
-        "SubmitSurveyResponseCommand": {
-            "SurveyId": "Guid?",
-            "ResponseId": "Guid?",
-            "ShareToken": "string?",
-            "Answers": "List<AnswerDto>",
-            "RespondentEmail": "string?",
-            "RespondentName": "string?",
-            "Language": "string?"
-        },
-        "GetSurveysQuery": {
-            "Page": "int?",
-            "PageSize": "int?",
-            "Status": "SurveyStatus?",
-            "Search": "string?",
-            "SortBy": "string?",
-            "SortDescending": "bool?"
-        },
-        "GetResponsesQuery": {
-            "SurveyId": "Guid",
-            "Page": "int?",
-            "PageSize": "int?",
-            "StartDate": "DateTime?",
-            "EndDate": "DateTime?"
-        },
-        "ExportResponsesCommand": {
-            "SurveyId": "Guid",
-            "Format": "ExportFormat",
-            "IncludeMetadata": "bool?",
-            "StartDate": "DateTime?",
-            "EndDate": "DateTime?",
-            "QuestionIds": "List<Guid>?"
-        },
-        "UpdateProfileCommand": {
-            "FirstName": "string?",
-            "LastName": "string?"
-        },
-        "UpdateUserPreferencesCommand": {
-            "Language": "string?",
-            "Theme": "string?",
-            "EmailNotifications": "bool?",
-            "DefaultNamespaceId": "Guid?"
-        },
-        "CreateEmailTemplateCommand": {
-            "Name": "string",
-            "Subject": "string",
-            "Body": "string",
-            "TemplateType": "EmailTemplateType",
-            "Language": "string?"
-        },
-        "UpdateEmailTemplateCommand": {
-            "Id": "Guid",
-            "Name": "string?",
-            "Subject": "string?",
-            "Body": "string?",
-            "IsDefault": "bool?"
-        },
-        "BulkDeleteResponsesCommand": {
-            "ResponseIds": "List<Guid>"
-        },
-        "BatchSyncQuestionsCommand": {
-            "SurveyId": "Guid",
-            "Questions": "List<QuestionSyncItem>"
-        },
-        "GetEmailTemplatesQuery": {
-            "Page": "int?",
-            "PageSize": "int?",
-            "TemplateType": "EmailTemplateType?",
-            "Search": "string?"
-        }
-    }
+    if model_name in _unresolved_models:
+        return {}
     
-    if model_name in known_models:
-        return known_models[model_name]
+    snapshot = load_schema_snapshot()
+    entry = snapshot["models"].get(model_name) if snapshot else None
+    if entry and is_source_fresh(entry["source"], snapshot["sources"]):
+        return dict(entry["properties"])
     
-    # Try to find the model file
-    if model_name:
-        # Search in Features directory
-        if model_name.endswith("Command") or model_name.endswith("Query"):
-            search_dirs = [FEATURES_PATH]
-        else:
-            search_dirs = [DTOS_PATH, FEATURES_PATH]
-        
-        for search_dir in search_dirs:
-            if search_dir.exists():
-                for file_path in search_dir.rglob("*.cs"):
-                    try:
-                        content = file_path.read_text(encoding='utf-8')
-                        if f"class {model_name}" in content or f"record {model_name}" in content:
-                            properties = extract_properties_from_content(content, model_name)
-                            if properties:
-                                return properties
-                    except:
-                        continue
+    if snapshot and not entry and model_name in snapshot["unresolved"]["names"]:
+        if snapshot["unresolved"]["fingerprint"] == source_tree_fingerprint():
+            _unresolved_models.add(model_name)
+            return {}
     
+    properties, file_path = find_model_properties(model_name)
+    if file_path is None:
+        _unresolved_models.add(model_name)
     return properties
 
 
+def find_model_properties(model_name: str) -> tuple:
+    """Search Features and DTOs for a model; returns (properties, source file or None)."""
+    # Commands and queries only live in Features
+    if model_name.endswith("Command") or model_name.endswith("Query"):
+        search_dirs = [FEATURES_PATH]
+    else:
+        search_dirs = [DTOS_PATH, FEATURES_PATH]
+    
+    for search_dir in search_dirs:
+        if search_dir.exists():
+            for file_path in sorted(search_dir.rglob("*.cs")):
+                content = read_type_source(file_path, model_name)
+                if content:
+                    properties = extract_properties_from_content(content, model_name)
+                    if properties:
+                        return properties, file_path
+    
+    return {}, None
+
+
+# =============================================================================
+# Schema Snapshot
+# =============================================================================
+
+SCHEMA_SNAPSHOT_PATH = Path(__file__).parent / "api_schema_snapshot.json"
+SCHEMA_SNAPSHOT_VERSION = 2
+
+_schema_snapshot = None
+_source_freshness = {}
+_unresolved_models = set()
+_tree_fingerprint = None
+
+
+def hash_source(file_path: Path) -> Optional[str]:
+    """SHA-256 of a file's bytes, or None if it cannot be read."""
+    data = map_source(file_path)
+    if data is None:
+        return None
+    try:
+        return hashlib.sha256(data).hexdigest()
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def load_schema_snapshot() -> Optional[dict]:
+    """Load the schema snapshot on first use; returns None if missing or of another version."""
+    global _schema_snapshot
+    if _schema_snapshot is None:
+        _schema_snapshot = {}
+        if SCHEMA_SNAPSHOT_PATH.exists():
+            try:
+                with open(SCHEMA_SNAPSHOT_PATH, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error reading {SCHEMA_SNAPSHOT_PATH}: {e}")
+                data = {}
+            if data.get("version") == SCHEMA_SNAPSHOT_VERSION:
+                _schema_snapshot = data
+            elif data:
+                print(f"Ignoring schema snapshot version {data.get('version')}; rebuild with --build-schema-snapshot")
+    return _schema_snapshot or None
+
+
+def is_source_fresh(source: str, sources: dict) -> bool:
+    """Check (once per run) that a snapshot source file still hashes to its recorded value."""
+    if source not in _source_freshness:
+        current = hash_source(Path(__file__).parent.parent / source)
+        fresh = current is not None and current == sources.get(source)
+        if not fresh:
+            print(f"  Schema snapshot is stale for {source}; rescanning (rebuild with --build-schema-snapshot)")
+        _source_freshness[source] = fresh
+    return _source_freshness[source]
+
+
+def source_tree_fingerprint() -> str:
+    """
+    Hash of the path and size of every .cs file in DTOs and Features, computed once per
+    run. Only stats files, so unresolved names can be trusted without scanning them.
+    """
+    global _tree_fingerprint
+    if _tree_fingerprint is None:
+        digest = hashlib.sha256()
+        for search_dir in (DTOS_PATH, FEATURES_PATH):
+            for file_path in sorted(search_dir.rglob("*.cs")):
+                digest.update(f"{relative_path(file_path)}:{file_path.stat().st_size}\n".encode("utf-8"))
+        _tree_fingerprint = digest.hexdigest()
+    return _tree_fingerprint
+
+
+def build_schema_snapshot() -> dict:
+    """Resolve every class/record declared in Features and DTOs into a schema snapshot."""
+    type_pattern = re.compile(rb"(?:class|record)\s+(\w+)")
+    type_names = set()
+    for search_dir in (DTOS_PATH, FEATURES_PATH):
+        for file_path in sorted(search_dir.rglob("*.cs")):
+            data = map_source(file_path)
+            if not data:
+                continue
+            try:
+                type_names.update(name.decode("ascii") for name in type_pattern.findall(data))
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+    
+    models = {}
+    sources = {}
+    for model_name in sorted(type_names):
+        properties, file_path = find_model_properties(model_name)
+        if file_path is None:
+            continue
+        source = relative_path(file_path)
+        if source not in sources:
+            sources[source] = hash_source(file_path)
+        models[model_name] = {"source": source, "properties": properties}
+    
+    # Models bound by controllers that cannot be resolved are recorded, so lookups
+    # for them skip the full directory scan while the source tree is unchanged
+    unresolved = set()
+    for file_path in sorted(CONTROLLERS_PATH.glob("*.cs")):
+        content = read_source(file_path, marker=b"[From")
+        for source, model_name in re.findall(r'\[From(Body|Query)\]\s*(\w+)', content or ""):
+            # Only [FromQuery] *Query objects are expanded into properties
+            if source == "Query" and not model_name.endswith("Query"):
+                continue
+            if model_name not in models and not find_model_properties(model_name)[1]:
+                unresolved.add(model_name)
+    
+    return {
+        "version": SCHEMA_SNAPSHOT_VERSION,
+        "sources": dict(sorted(sources.items())),
+        "models": models,
+        "unresolved": {
+            "fingerprint": source_tree_fingerprint(),
+            "names": sorted(unresolved)
+        }
+    }
+
+
 def extract_properties_from_content(content: str, class_name: str) -> dict:
-    """Extract properties from C# class/record content."""
+    """Extract properties from C# class/record content, including positional record parameters."""
     properties = {}
     
-    # Find the class/record definition
-    pattern = rf'(?:class|record)\s+{class_name}[^{{]*\{{'
+    # Find the class/record declaration, up to its body or the ';' of a body-less record
+    pattern = rf'(class|record)\s+{class_name}\b(?:<[^>]*>)?\s*(\()?[^{{;]*([{{;])'
     match = re.search(pattern, content)
     if not match:
         return properties
     
-    # Get content after class definition
-    start = match.end()
-    brace_count = 1
-    end = start
+    # Positional record parameters: record X(Type A, Type B = default)
+    if match.group(1) == "record" and match.group(2):
+        open_index = match.start(2)
+        depth = 0
+        for i in range(open_index, len(content)):
+            if content[i] == '(':
+                depth += 1
+            elif content[i] == ')':
+                depth -= 1
+                if depth == 0:
+                    break
+        for param in split_params(content[open_index + 1:i]):
+            param = re.sub(r'\[[^\]]*\]', "", param).split("=")[0].strip()
+            param_match = re.search(r'(\w+(?:<[^>]+>)?\??)\s+(\w+)$', param)
+            if param_match:
+                properties[param_match.group(2)] = param_match.group(1)
     
-    for i, char in enumerate(content[start:], start):
-        if char == '{':
-            brace_count += 1
-        elif char == '}':
-            brace_count -= 1
-            if brace_count == 0:
-                end = i
-                break
+    if match.group(3) == ";":
+        return properties
     
-    class_body = content[start:end]
+    # Get content of the class definition
+    class_body = extract_block(content, match.end() - 1)
     
     # Match properties
     prop_pattern = re.compile(
@@ -497,15 +645,6 @@ def extract_properties_from_content(content: str, class_name: str) -> dict:
         prop_name = prop_match.group(2)
         properties[prop_name] = prop_type
     
-    # For records, also check constructor-style properties
-    record_props = re.findall(
-        r'public\s+(?:required\s+)?(\w+(?:<[^>]+>)?(?:\?)?)\s+(\w+)\s*(?:,|;|\))',
-        content[:match.start()]
-    )
-    for prop_type, prop_name in record_props:
-        if prop_name not in properties:
-            properties[prop_name] = prop_type
-    
     return properties
 
 
@@ -545,11 +684,16 @@ def generate_json_output(controllers: list) -> dict:
                 "action": endpoint.action_name,
                 "description": endpoint.description,
                 "requiresAuth": endpoint.requires_auth,
+                "mediatorRequest": endpoint.request_type,
+                "handler": endpoint.handler,
                 "parameters": [asdict(p) for p in endpoint.parameters],
                 "requestBody": None,
                 "responses": []
             }
             
+            if endpoint.callers is not None:
+                ep_dict["callers"] = endpoint.callers
+            
             if endpoint.request_model:
                 ep_dict["requestBody"] = {
                     "model": endpoint.request_model,
@@ -611,6 +755,10 @@ def generate_markdown_output(controllers: list) -> str:
             lines.append(f"**Action:** `{endpoint.action_name}`")
             lines.append("")
             
+            if endpoint.callers is not None:
+                lines.append(f"**Frontend Callers:** {len(endpoint.callers) or 'None'}")
+                lines.append("")
+            
             # Parameters
             if endpoint.parameters:
                 lines.append("#### Parameters")
@@ -661,6 +809,778 @@ def generate_markdown_output(controllers: list) -> str:
     return "\n".join(lines)
 
 
+# =============================================================================
+# Precompressed Artifacts
+# =============================================================================
+
+COMPRESSED_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+def compute_etag(data: bytes) -> str:
+    """Strong ETag derived from the content hash."""
+    digest = hashlib.sha256(data).digest()
+    return '"' + base64.urlsafe_b64encode(digest[:18]).decode("ascii") + '"'
+
+
+def remove_compressed_artifacts(files: list, output: str) -> None:
+    """
+    Delete compressed variants, the minified JSON and the manifest left by an earlier
+    --compress run, so they can never disagree with freshly written artifacts.
+    """
+    min_file = OUTPUT_PATH / f"{output}.min.json"
+    for file_path in list(files) + [min_file]:
+        for suffix in COMPRESSED_SUFFIXES.values():
+            file_path.with_name(file_path.name + suffix).unlink(missing_ok=True)
+    min_file.unlink(missing_ok=True)
+    (OUTPUT_PATH / f"{output}.manifest.json").unlink(missing_ok=True)
+
+
+def compress_artifacts(files: list) -> dict:
+    """
+    Write .gz (and .br, when brotli is installed) variants of each file at maximum
+    compression and return a manifest of sizes and strong ETags for every variant.
+    """
+    manifest = {
+        "generatedAt": __import__('datetime').datetime.now().isoformat(),
+        "files": {}
+    }
+    
+    for file_path in files:
+        data = file_path.read_bytes()
+        entry = {
+            "size": len(data),
+            "etag": compute_etag(data),
+            "encodings": {}
+        }
+        
+        # mtime=0 keeps the .gz bytes (and so the ETag) stable across runs
+        variants = {"gzip": (".gz", gzip.compress(data, compresslevel=9, mtime=0))}
+        if brotli is not None:
+            variants["br"] = (".br", brotli.compress(data, quality=11))
+        
+        # Drop variants left over from earlier runs that this run did not produce,
+        # so servers never pick up stale bytes missing from the manifest
+        for encoding, suffix in COMPRESSED_SUFFIXES.items():
+            if encoding not in variants:
+                file_path.with_name(file_path.name + suffix).unlink(missing_ok=True)
+        
+        for encoding, (suffix, compressed) in variants.items():
+            variant_path = file_path.with_name(file_path.name + suffix)
+            variant_path.write_bytes(compressed)
+            entry["encodings"][encoding] = {
+                "file": variant_path.name,
+                "size": len(compressed),
+                "etag": compute_etag(compressed)
+            }
+        
+        manifest["files"][file_path.name] = entry
+    
+    return manifest
+
+
+# =============================================================================
+# Data-Access Audit
+# =============================================================================
+
+FINDING_WEIGHTS = {
+    "query_in_loop": 5,
+    "unbounded_list": 3,
+    "missing_no_tracking": 2,
+    "include_chain": 1,
+}
+
+# Include()/ThenInclude() calls tolerated in a single query before it is flagged
+INCLUDE_CHAIN_THRESHOLD = 3
+
+DATA_ACCESS_CALL = re.compile(r'await\s+(_\w+)\.(\w+Async)\s*\(')
+MATERIALIZING_CALL = re.compile(r'\.(?:ToListAsync|ToArrayAsync|FirstOrDefaultAsync|FirstAsync|SingleOrDefaultAsync|SingleAsync|FindAsync)\s*\(')
+
+
+def relative_path(file_path: Path) -> str:
+    """Path relative to the repository root, for reports."""
+    return file_path.relative_to(Path(__file__).parent.parent).as_posix()
+
+
+COMMENT_PATTERN = re.compile(r'("(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\')|//[^\n]*|/\*.*?\*/', re.DOTALL)
+
+
+def strip_comments(code: str) -> str:
+    """Remove // and /* */ comments, leaving string literals (e.g. "http://...") intact."""
+    return COMMENT_PATTERN.sub(lambda m: m.group(1) or "", code)
+
+
+def extract_methods(content: str) -> dict:
+    """Extract method bodies (block or expression-bodied) keyed by method name; overloads are merged."""
+    methods = {}
+    content = strip_comments(content)
+    method_pattern = re.compile(
+        r'(?:public|private|protected|internal)\s+(?:static\s+)?(?:async\s+)?[\w<>\[\],?()\s]+?\s(\w+)(?:<[^>]+>)?\s*\(',
+    )
+    for match in method_pattern.finditer(content):
+        name = match.group(1)
+        # Skip over the parameter list
+        depth = 0
+        i = match.end() - 1
+        while i < len(content):
+            if content[i] == '(':
+                depth += 1
+            elif content[i] == ')':
+                depth -= 1
+                if depth == 0:
+                    break
+            i += 1
+        rest = content[i + 1:]
+        arrow = re.match(r'\s*(?:where[^{=]*)?=>', rest)
+        if arrow:
+            end = rest.find(';', arrow.end())
+            body = rest[arrow.end():end if end != -1 else len(rest)]
+        else:
+            brace = re.match(r'\s*(?:where[^{;]*)?\{', rest)
+            if not brace:
+                continue
+            body = extract_block(rest, brace.end() - 1)
+        methods[name] = methods.get(name, "") + body
+    return methods
+
+
+def index_handlers() -> dict:
+    """Map MediatR request type -> (handler class, file path, file content)."""
+    handlers = {}
+    handler_pattern = re.compile(r'class\s+(\w+)\b[^{]*?IRequestHandler<\s*(\w+)', re.DOTALL)
+    for file_path in sorted(FEATURES_PATH.rglob("*.cs")):
+        content = read_source(file_path, marker=b"IRequestHandler<")
+        if content is None:
+            continue
+        for match in handler_pattern.finditer(content):
+            handlers[match.group(2)] = (match.group(1), file_path, content)
+    return handlers
+
+
+def index_repositories() -> dict:
+    """Map repository interface name -> (file path, {method name: body})."""
+    repositories = {}
+    # Generic SpecificationRepository<T> is skipped: its queries are audited through the specifications
+    class_pattern = re.compile(r'class\s+(\w+Repository)\b(?!<)')
+    for file_path in sorted(REPOSITORIES_PATH.glob("*.cs")):
+        content = read_source(file_path, marker=b"Repository")
+        if content is None:
+            continue
+        class_match = class_pattern.search(content)
+        if class_match:
+            repositories[f"I{class_match.group(1)}"] = (file_path, extract_methods(content))
+    return repositories
+
+
+def index_specifications() -> dict:
+    """Map specification class name -> (file path, class body)."""
+    specifications = {}
+    spec_pattern = re.compile(r'class\s+(\w+Spec\w*)\b[^{;]*\{')
+    for file_path in sorted(SPECIFICATIONS_PATH.rglob("*.cs")):
+        content = read_source(file_path, marker=b"Spec")
+        if content is None:
+            continue
+        content = strip_comments(content)
+        for match in spec_pattern.finditer(content):
+            specifications[match.group(1)] = (file_path, extract_block(content, match.end() - 1))
+    return specifications
+
+
+def find_loop_spans(content: str) -> list:
+    """Return (start, end) offsets of the bodies of all foreach/for/while loops in content."""
+    spans = []
+    for match in re.finditer(r'\b(?:foreach|for|while)\s*\(', content):
+        depth = 0
+        i = match.end() - 1
+        while i < len(content):
+            if content[i] == '(':
+                depth += 1
+            elif content[i] == ')':
+                depth -= 1
+                if depth == 0:
+                    break
+            i += 1
+        brace = re.match(r'\s*\{', content[i + 1:])
+        if brace:
+            open_index = i + brace.end()
+            spans.append((open_index + 1, open_index + 1 + len(extract_block(content, open_index))))
+    return spans
+
+
+def in_loop(offset: int, loop_spans: list) -> bool:
+    """Whether offset falls inside any loop body; nested loops still count a call site once."""
+    return any(start <= offset < end for start, end in loop_spans)
+
+
+def scan_query_body(body: str, location: str, is_read: bool, can_page: bool = True) -> list:
+    """Scan one query (repository method or specification) for data-access smells."""
+    findings = []
+    
+    include_count = len(re.findall(r'\.(?:Then)?Include\s*\(', body))
+    if include_count >= INCLUDE_CHAIN_THRESHOLD:
+        split_note = "" if "AsSplitQuery" in body else ", no AsSplitQuery()"
+        findings.append(DataAccessFinding(
+            kind="include_chain",
+            location=location,
+            detail=f"{include_count} Include/ThenInclude calls{split_note}",
+            weight=FINDING_WEIGHTS["include_chain"] * (include_count - INCLUDE_CHAIN_THRESHOLD + 1)
+        ))
+    
+    no_tracking = "AsNoTracking" in body or "AsReadOnly()" in body
+    if is_read and not no_tracking and (MATERIALIZING_CALL.search(body) or "Query." in body):
+        findings.append(DataAccessFinding(
+            kind="missing_no_tracking",
+            location=location,
+            detail="read-only query without AsNoTracking()",
+            weight=FINDING_WEIGHTS["missing_no_tracking"]
+        ))
+    
+    paged = re.search(r'\.(?:Skip|Take)\s*\(|ApplyPaging\s*\(', body)
+    if can_page and "ToListAsync" in body and not paged:
+        findings.append(DataAccessFinding(
+            kind="unbounded_list",
+            location=location,
+            detail="ToListAsync without Skip/Take",
+            weight=FINDING_WEIGHTS["unbounded_list"]
+        ))
+    
+    return findings
+
+
+def audit_handler(request_type: str, handler_file: Path, content: str, repositories: dict, specifications: dict) -> list:
+    """Follow a handler into the repositories and specifications it uses and collect findings."""
+    findings = []
+    is_read = request_type.endswith("Query")
+    handler_location = relative_path(handler_file)
+    content = strip_comments(content)
+    
+    # Field name -> repository interface, e.g. _surveyRepository -> ISurveyRepository
+    fields = {}
+    for type_name, field_name in re.findall(r'(I\w+Repository|IUnitOfWork|\w*DbContext)(?:<\w+>)?\s+(_\w+)', content):
+        fields[field_name] = type_name
+    
+    loop_spans = find_loop_spans(content)
+    for call in DATA_ACCESS_CALL.finditer(content):
+        field_name, method = call.groups()
+        if field_name in fields and in_loop(call.start(), loop_spans):
+            findings.append(DataAccessFinding(
+                kind="query_in_loop",
+                location=handler_location,
+                detail=f"{field_name}.{method} awaited inside a loop",
+                weight=FINDING_WEIGHTS["query_in_loop"]
+            ))
+    
+    seen = set()
+    for field_name, method in DATA_ACCESS_CALL.findall(content):
+        interface = fields.get(field_name)
+        if interface not in repositories or (interface, method) in seen:
+            continue
+        seen.add((interface, method))
+        repo_file, methods = repositories[interface]
+        body = methods.get(method)
+        if body is None:
+            continue
+        # Follow delegation to sibling methods one level deep
+        for callee in set(re.findall(r'\b(\w+Async)\s*\(', body)) - {method}:
+            body += methods.get(callee, "")
+        location = f"{relative_path(repo_file)}::{method}"
+        findings.extend(scan_query_body(body, location, is_read))
+        loop_spans = find_loop_spans(body)
+        for call in MATERIALIZING_CALL.finditer(body):
+            if in_loop(call.start(), loop_spans):
+                findings.append(DataAccessFinding(
+                    kind="query_in_loop",
+                    location=location,
+                    detail="query executed inside a loop",
+                    weight=FINDING_WEIGHTS["query_in_loop"]
+                ))
+    
+    lists_specs = bool(re.search(r'SpecRepository\w*\.ListAsync\s*\(', content))
+    for spec_name in sorted(set(re.findall(r'new\s+(\w+Spec\w*)\s*\(', content))):
+        if spec_name not in specifications:
+            continue
+        spec_file, body = specifications[spec_name]
+        location = f"{relative_path(spec_file)}::{spec_name}"
+        body = body.replace("Query.Include", ".Include")
+        findings.extend(scan_query_body(
+            body + (" ToListAsync" if lists_specs else ""),
+            location,
+            is_read,
+            can_page=lists_specs
+        ))
+    
+    return findings
+
+
+def link_handlers(controllers: list) -> dict:
+    """Set each endpoint's MediatR handler class; returns the handler index for reuse."""
+    handlers = index_handlers()
+    for controller in controllers:
+        for endpoint in controller.endpoints:
+            if endpoint.request_type in handlers:
+                endpoint.handler = handlers[endpoint.request_type][0]
+    return handlers
+
+
+def audit_data_access(controllers: list, handlers: dict) -> list:
+    """Rank endpoints, already linked by link_handlers, by the data-access risk of their handlers."""
+    repositories = index_repositories()
+    specifications = index_specifications()
+    
+    report = []
+    for controller in controllers:
+        for endpoint in controller.endpoints:
+            entry = {
+                "method": endpoint.http_method,
+                "route": endpoint.route,
+                "controller": endpoint.controller,
+                "action": endpoint.action_name,
+                "requestType": endpoint.request_type,
+                "handler": endpoint.handler,
+                "handlerFile": None,
+                "score": 0,
+                "findings": []
+            }
+            if endpoint.handler:
+                _, handler_file, content = handlers[endpoint.request_type]
+                findings = audit_handler(endpoint.request_type, handler_file, content, repositories, specifications)
+                entry["handlerFile"] = relative_path(handler_file)
+                entry["score"] = sum(f.weight for f in findings)
+                entry["findings"] = [asdict(f) for f in findings]
+            report.append(entry)
+    
+    report.sort(key=lambda e: (-e["score"], e["route"], e["method"]))
+    return report
+
+
+def print_audit_summary(report: list, top: int = 20) -> None:
+    """Print the highest-risk endpoints of a data-access audit."""
+    linked = sum(1 for e in report if e["handler"])
+    print(f"\nData-access audit: {linked}/{len(report)} endpoints linked to handlers")
+    print(f"{'Score':>5}  {'Method':<6} {'Route':<60} Handler")
+    for entry in report[:top]:
+        if not entry["score"]:
+            break
+        print(f"{entry['score']:>5}  {entry['method']:<6} {entry['route']:<60} {entry['handler']}")
+    unlinked = [e for e in report if not e["handler"]]
+    if unlinked:
+        print(f"  {len(unlinked)} endpoints without a resolved handler")
+
+
+# =============================================================================
+# Frontend Call-Site Index
+# =============================================================================
+
+FRONTEND_EXTENSIONS = (".ts", ".tsx")
+FRONTEND_SKIP_DIRS = {"node_modules", "dist", "build", ".next", ".turbo", "coverage"}
+
+# One pass per file: API path literals (with ${...} segments) and CONSTANT.member references
+FRONTEND_PATTERN = re.compile(
+    r'(?P<path>/api(?:/(?:[\w.~-]+|\$\{[^}]*\}))+)'
+    r'|\b(?P<symbol>[A-Z][A-Z0-9_]*(?:\.\w+)+)'
+)
+OBJECT_TOKEN_PATTERN = re.compile(r'(\w+)\s*[:=]\s*\{|\{|\}')
+OBJECT_KEY_PATTERN = re.compile(r'\s*(\w+)\s*:')
+HTTP_CALL_PATTERN = re.compile(r'\.(get|post|put|patch|delete)\s*(?:<[^;]*?>)?\s*\(', re.IGNORECASE)
+SYMBOL_SUFFIX_PATTERN = re.compile(r'(?:\([^()]*\))?\}((?:/(?:[\w.~-]+|\$\{[^}]*\}))+)')
+FETCH_METHOD_PATTERN = re.compile(r'method:\s*[\'"](\w+)[\'"]')
+LINE_COMMENT_PATTERN = re.compile(r'^\s*(?://|/?\*)|(?<![:/])//')
+
+
+def find_frontend_files() -> list:
+    """All TS/TSX sources under front/, skipping dependency and build output directories."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(FRONTEND_PATH):
+        dirnames[:] = sorted(d for d in dirnames if d not in FRONTEND_SKIP_DIRS)
+        for filename in sorted(filenames):
+            if filename.endswith(FRONTEND_EXTENSIONS) and not filename.endswith(".d.ts"):
+                files.append(Path(dirpath) / filename)
+    return files
+
+
+def infer_http_method(content: str, start: int, end: int) -> Optional[str]:
+    """Infer the HTTP method of a call site from client.get(...)/fetch(..., { method }) around it."""
+    before = content[max(0, start - 200):start]
+    call_match = None
+    for call_match in HTTP_CALL_PATTERN.finditer(before):
+        pass
+    if call_match and ";" not in before[call_match.end():]:
+        return call_match.group(1).upper()
+    if "fetch(" in before[-120:]:
+        method_match = FETCH_METHOD_PATTERN.search(content, end, end + 300)
+        return method_match.group(1).upper() if method_match else "GET"
+    return None
+
+
+def scan_frontend_file(file_path: Path) -> list:
+    """
+    Scan one TS/TSX file. Returns (kind, value, line, method, extra) tuples, where kind is
+    "path" or "symbol". For paths, extra is the CONSTANT.group.key the literal is assigned
+    to; for symbols, it is any path appended in a template, e.g. `${API.x.byId(id)}/send`.
+    """
+    content = read_source(file_path)
+    if content is None:
+        return []
+    
+    line_starts = [0] + [m.end() for m in re.finditer(r'\n', content)]
+    hits = []
+    object_stack = []
+    object_tokens = OBJECT_TOKEN_PATTERN.finditer(content)
+    pending_token = next(object_tokens, None)
+    
+    for match in FRONTEND_PATTERN.finditer(content):
+        line_index = bisect.bisect_right(line_starts, match.start()) - 1
+        line_start = line_starts[line_index]
+        # Skip comments and doc-style routes such as /api/surveys/{surveyId}
+        prefix = content[line_start:match.start()]
+        if LINE_COMMENT_PATTERN.search(prefix) or content.startswith(("{", "/{"), match.end()):
+            continue
+        method = infer_http_method(content, match.start(), match.end())
+        
+        if match.group("symbol"):
+            suffix_match = SYMBOL_SUFFIX_PATTERN.match(content, match.end())
+            suffix = suffix_match.group(1) if suffix_match else ""
+            hits.append(("symbol", match.group("symbol"), line_index + 1, method, suffix))
+            continue
+        
+        # Track object-literal nesting up to this line to name the key the path is assigned to
+        while pending_token and pending_token.start() < line_start:
+            if pending_token.group(1):
+                object_stack.append(pending_token.group(1))
+            elif pending_token.group() == "{":
+                object_stack.append(None)
+            elif object_stack:
+                object_stack.pop()
+            pending_token = next(object_tokens, None)
+        
+        defines = None
+        key_match = OBJECT_KEY_PATTERN.match(content, line_start)
+        if key_match and object_stack and all(object_stack):
+            defines = ".".join(object_stack + [key_match.group(1)])
+        hits.append(("path", match.group("path"), line_index + 1, method, defines))
+    
+    return hits
+
+
+def compile_route_matcher(controllers: list) -> dict:
+    """Compile every endpoint route into a segment trie; {param} segments become wildcards."""
+    root = {"literal": {}, "param": None, "endpoints": []}
+    for controller in controllers:
+        for endpoint in controller.endpoints:
+            node = root
+            for segment in endpoint.route.strip("/").split("/"):
+                if segment.startswith("{"):
+                    if node["param"] is None:
+                        node["param"] = {"literal": {}, "param": None, "endpoints": []}
+                    node = node["param"]
+                else:
+                    node = node["literal"].setdefault(segment.lower(), {"literal": {}, "param": None, "endpoints": []})
+            node["endpoints"].append(endpoint)
+    return root
+
+
+def match_route(node: dict, segments: list) -> list:
+    """Endpoints whose route matches the path segments, preferring literal over parameter segments."""
+    if not segments:
+        return node["endpoints"]
+    segment, rest = segments[0], segments[1:]
+    if not segment.startswith("${"):
+        child = node["literal"].get(segment.lower())
+        if child:
+            found = match_route(child, rest)
+            if found:
+                return found
+    if node["param"]:
+        return match_route(node["param"], rest)
+    return []
+
+
+def resolve_call(matcher: dict, path: str, method: Optional[str]) -> list:
+    """Endpoints a frontend path resolves to, narrowed by HTTP method when it is known."""
+    endpoints = match_route(matcher, path.strip("/").split("/"))
+    if method:
+        same_method = [e for e in endpoints if e.http_method == method]
+        if same_method:
+            return same_method
+    return endpoints
+
+
+def index_frontend_callers(controllers: list, workers: Optional[int] = None) -> dict:
+    """
+    Attach frontend call sites (file, line) to every endpoint. Path literals assigned to a
+    constant (e.g. API_ENDPOINTS.surveys.byId) are attributed to the places using that
+    constant instead of the definition itself.
+    """
+    matcher = compile_route_matcher(controllers)
+    files = find_frontend_files()
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(scan_frontend_file, files, chunksize=16))
+    
+    for controller in controllers:
+        for endpoint in controller.endpoints:
+            endpoint.callers = []
+    
+    symbols = {}
+    unmatched = []
+    direct = []
+    for file_path, hits in zip(files, results):
+        location = relative_path(file_path)
+        for kind, value, line, method, defines in hits:
+            if kind != "path":
+                continue
+            if defines:
+                symbols[defines] = value
+            else:
+                direct.append((location, line, value, method, None))
+    
+    for file_path, hits in zip(files, results):
+        location = relative_path(file_path)
+        for kind, value, line, method, suffix in hits:
+            if kind == "symbol" and value in symbols:
+                direct.append((location, line, symbols[value] + suffix, method, value))
+    
+    for location, line, path, method, via in direct:
+        endpoints = resolve_call(matcher, path, method)
+        if not endpoints:
+            unmatched.append({"file": location, "line": line, "path": path})
+        for endpoint in endpoints:
+            caller = {"file": location, "line": line}
+            if via:
+                caller["via"] = via
+            endpoint.callers.append(caller)
+    
+    all_endpoints = [e for c in controllers for e in c.endpoints]
+    return {
+        "generatedAt": __import__('datetime').datetime.now().isoformat(),
+        "filesScanned": len(files),
+        "hot": [
+            {"method": e.http_method, "route": e.route, "action": e.action_name, "callers": len(e.callers)}
+            for e in sorted(all_endpoints, key=lambda e: (-len(e.callers), e.route)) if e.callers
+        ],
+        "uncalled": [
+            {"method": e.http_method, "route": e.route, "controller": e.controller, "action": e.action_name}
+            for e in all_endpoints if not e.callers
+        ],
+        "unmatchedCalls": unmatched
+    }
+
+
+# =============================================================================
+# Search Index
+# =============================================================================
+
+SEARCH_INDEX_VERSION = 1
+
+
+def split_identifier(name: str) -> list:
+    """Split an identifier at camelCase/PascalCase and digit boundaries (lowercased)."""
+    return [part.lower() for part in re.findall(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+', name)]
+
+
+def tokenize_text(text: str) -> set:
+    """Tokenize free text or identifiers into whole words plus their camelCase parts."""
+    tokens = set()
+    for word in re.findall(r'[A-Za-z0-9]+', text or ""):
+        tokens.add(word.lower())
+        tokens.update(split_identifier(word))
+    return tokens
+
+
+def tokenize_route(route: str) -> set:
+    """Tokenize a route into its path segments, with {param} braces and constraints stripped."""
+    tokens = set()
+    for segment in route.split("/"):
+        segment = re.sub(r'[{}]|:[^}/]*', "", segment).strip()
+        if not segment:
+            continue
+        tokens.add(segment.lower())
+        tokens.update(tokenize_text(segment))
+    return tokens
+
+
+def endpoint_search_tokens(endpoint: Endpoint) -> set:
+    """Collect every searchable token of an endpoint: route, action, description and models."""
+    tokens = tokenize_route(endpoint.route)
+    tokens.update(tokenize_text(endpoint.action_name))
+    tokens.update(tokenize_text(endpoint.description))
+    tokens.update(tokenize_text(endpoint.request_model or ""))
+    for prop_name in endpoint.request_properties:
+        tokens.update(tokenize_text(prop_name))
+    for param in endpoint.parameters:
+        tokens.update(tokenize_text(param.name))
+    for resp in endpoint.responses:
+        tokens.update(tokenize_text(resp.model_type or ""))
+    return tokens
+
+
+def encode_postings(doc_ids: list) -> str:
+    """Encode a sorted list of document ids as base64 delta-varints."""
+    out = bytearray()
+    previous = 0
+    for doc_id in doc_ids:
+        delta = doc_id - previous
+        previous = doc_id
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return base64.b64encode(bytes(out)).decode("ascii")
+
+
+def decode_postings(encoded: str) -> list:
+    """Decode a posting list produced by encode_postings."""
+    doc_ids = []
+    current = 0
+    delta = 0
+    shift = 0
+    for byte in base64.b64decode(encoded):
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += delta
+        doc_ids.append(current)
+        delta = 0
+        shift = 0
+    return doc_ids
+
+
+def build_search_index(controllers: list) -> dict:
+    """Build a compact inverted index over all parsed endpoints."""
+    docs = []
+    inverted = {}
+    
+    for controller in controllers:
+        for endpoint in controller.endpoints:
+            doc_id = len(docs)
+            docs.append({
+                "method": endpoint.http_method,
+                "route": endpoint.route,
+                "action": endpoint.action_name,
+                "controller": endpoint.controller
+            })
+            for token in endpoint_search_tokens(endpoint):
+                inverted.setdefault(token, []).append(doc_id)
+    
+    terms = sorted(inverted)
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "docs": docs,
+        "terms": terms,
+        "postings": [encode_postings(inverted[term]) for term in terms]
+    }
+
+
+class SearchIndex:
+    """
+    Query helper over an index produced by build_search_index.
+    Every query word is treated as a prefix; words are ANDed together.
+    """
+
+    def __init__(self, data: dict):
+        if data.get("version") != SEARCH_INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version: {data.get('version')}")
+        self.docs = data["docs"]
+        self.terms = data["terms"]
+        self._encoded = data["postings"]
+        self._decoded = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "SearchIndex":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _postings(self, term_index: int) -> list:
+        postings = self._decoded.get(term_index)
+        if postings is None:
+            postings = decode_postings(self._encoded[term_index])
+            self._decoded[term_index] = postings
+        return postings
+
+    def prefix_ids(self, prefix: str) -> set:
+        """Return the ids of all documents containing a term starting with prefix."""
+        doc_ids = set()
+        i = bisect.bisect_left(self.terms, prefix)
+        while i < len(self.terms) and self.terms[i].startswith(prefix):
+            doc_ids.update(self._postings(i))
+            i += 1
+        return doc_ids
+
+    def search(self, query: str) -> list:
+        """Return the documents matching every word of query, in document order."""
+        words = re.findall(r'[a-z0-9]+', query.lower())
+        if not words:
+            return []
+        
+        result = None
+        for word in sorted(words, key=len, reverse=True):
+            ids = self.prefix_ids(word)
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        return [self.docs[doc_id] for doc_id in sorted(result)]
+
+
+def build_linear_corpus(controllers: list) -> list:
+    """Pre-tokenize every endpoint once for linear_search."""
+    return [(endpoint, endpoint_search_tokens(endpoint)) for controller in controllers for endpoint in controller.endpoints]
+
+
+def linear_search(corpus: list, query: str) -> list:
+    """Reference search: scan every endpoint's tokens and prefix-match each query word, like SearchIndex.search."""
+    words = re.findall(r'[a-z0-9]+', query.lower())
+    if not words:
+        return []
+    
+    return [
+        endpoint for endpoint, tokens in corpus
+        if all(any(token.startswith(word) for token in tokens) for word in words)
+    ]
+
+
+def benchmark_search(controllers: list, index: SearchIndex, rounds: int = 200) -> None:
+    """Compare prefix queries against the index with a linear scan over all endpoints."""
+    queries = ["survey", "get", "resp", "email template", "id", "namespace user", "q", "export"]
+    queries += [term[:4] for term in index.terms[::max(1, len(index.terms) // 20)]]
+    
+    corpus = build_linear_corpus(controllers)
+    linear_rounds = max(1, rounds // 10)
+    
+    def run(search, rounds: int) -> float:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for query in queries:
+                search(query)
+        return (time.perf_counter() - start) / (rounds * len(queries)) * 1e6
+    
+    for query in queries:
+        indexed = [(d["method"], d["route"], d["action"], d["controller"]) for d in index.search(query)]
+        linear = [(e.http_method, e.route, e.action_name, e.controller) for e in linear_search(corpus, query)]
+        assert indexed == linear, f"Index and linear scan disagree for {query!r}: {len(indexed)} vs {len(linear)} results"
+    
+    fresh = SearchIndex({
+        "version": SEARCH_INDEX_VERSION,
+        "docs": index.docs,
+        "terms": index.terms,
+        "postings": index._encoded
+    })
+    start = time.perf_counter()
+    for query in queries:
+        fresh.search(query)
+    cold_us = (time.perf_counter() - start) / len(queries) * 1e6
+    
+    indexed_us = run(index.search, rounds)
+    linear_us = run(lambda query: linear_search(corpus, query), linear_rounds)
+    
+    print(f"\nSearch benchmark ({len(queries)} queries, {rounds}/{linear_rounds} index/linear rounds, "
+          f"{len(index.docs)} endpoints, {len(index.terms)} terms)")
+    print(f"  Index (cold):  {cold_us:8.1f} us/query")
+    print(f"  Index (warm):  {indexed_us:8.1f} us/query")
+    print(f"  Linear scan:   {linear_us:8.1f} us/query")
+    if indexed_us:
+        print(f"  Speedup:       {linear_us / indexed_us:8.1f}x")
+
+
 def get_example_value(prop_type: str) -> any:
     """Get an example value for a property type."""
     prop_type = prop_type.rstrip("?").strip()
@@ -695,8 +1615,23 @@ def main():
     parser = argparse.ArgumentParser(description="Generate API documentation from C# controllers")
     parser.add_argument("--output", "-o", default="api_docs", help="Output filename (without extension)")
     parser.add_argument("--format", "-f", choices=["json", "md", "both"], default="both", help="Output format")
+    parser.add_argument("--no-search-index", action="store_true", help="Skip writing the search index")
+    parser.add_argument("--benchmark-search", action="store_true", help="Benchmark the search index against a linear scan")
+    parser.add_argument("--audit-data-access", action="store_true", help="Write a per-endpoint data-access risk report")
+    parser.add_argument("--compress", action="store_true", help="Write minified JSON, .gz/.br variants and an ETag manifest")
+    parser.add_argument("--frontend-callers", action="store_true", help="Index frontend call sites for each endpoint")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes for the frontend scan")
+    parser.add_argument("--build-schema-snapshot", action="store_true", help=f"Regenerate {SCHEMA_SNAPSHOT_PATH.name} from the C# sources and exit")
     args = parser.parse_args()
     
+    if args.build_schema_snapshot:
+        snapshot = build_schema_snapshot()
+        with open(SCHEMA_SNAPSHOT_PATH, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        print(f"Schema snapshot: {SCHEMA_SNAPSHOT_PATH} "
+              f"({len(snapshot['models'])} models from {len(snapshot['sources'])} files)")
+        return 0
+    
     print(f"Scanning controllers in: {CONTROLLERS_PATH}")
     
     if not CONTROLLERS_PATH.exists():
@@ -716,25 +1651,86 @@ def main():
             print(f"    Found {len(controller.endpoints)} endpoints")
     
     print(f"\nTotal: {len(controllers)} controllers, {sum(len(c.endpoints) for c in controllers)} endpoints")
+    print(f"Source scan: {SCAN_STATS['mapped']} files mapped, {SCAN_STATS['decoded']} decoded "
+          f"({SCAN_STATS['decoded_bytes'] // 1024} KiB)")
+    
+    handlers = link_handlers(controllers)
     
     # Create output directory
     OUTPUT_PATH.mkdir(exist_ok=True)
     
+    written = []
+    
+    if args.frontend_callers:
+        print(f"\nScanning frontend in: {FRONTEND_PATH}")
+        callers_report = index_frontend_callers(controllers, args.jobs)
+        callers_file = OUTPUT_PATH / f"{args.output}.callers.json"
+        with open(callers_file, "w", encoding="utf-8") as f:
+            json.dump(callers_report, f, indent=2)
+        written.append(callers_file)
+        print(f"  {callers_report['filesScanned']} files, {len(callers_report['hot'])} endpoints called, "
+              f"{len(callers_report['uncalled'])} without callers, {len(callers_report['unmatchedCalls'])} unmatched calls")
+        print(f"Frontend callers: {callers_file}")
+    
     # Generate outputs
     if args.format in ["json", "both"]:
         json_output = generate_json_output(controllers)
         json_file = OUTPUT_PATH / f"{args.output}.json"
         with open(json_file, "w", encoding="utf-8") as f:
             json.dump(json_output, f, indent=2)
+        written.append(json_file)
         print(f"\nJSON documentation: {json_file}")
+        
+        if args.compress:
+            min_file = OUTPUT_PATH / f"{args.output}.min.json"
+            with open(min_file, "w", encoding="utf-8") as f:
+                json.dump(json_output, f, separators=(",", ":"))
+            written.append(min_file)
+            print(f"Minified JSON: {min_file}")
     
     if args.format in ["md", "both"]:
         md_output = generate_markdown_output(controllers)
         md_file = OUTPUT_PATH / f"{args.output}.md"
         with open(md_file, "w", encoding="utf-8") as f:
             f.write(md_output)
+        written.append(md_file)
         print(f"Markdown documentation: {md_file}")
     
+    if args.audit_data_access:
+        audit_report = audit_data_access(controllers, handlers)
+        audit_file = OUTPUT_PATH / f"{args.output}.data_access.json"
+        with open(audit_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "generatedAt": __import__('datetime').datetime.now().isoformat(),
+                "weights": FINDING_WEIGHTS,
+                "endpoints": audit_report
+            }, f, indent=2)
+        written.append(audit_file)
+        print(f"Data-access audit: {audit_file}")
+        print_audit_summary(audit_report)
+    
+    if not args.no_search_index or args.benchmark_search:
+        index_data = build_search_index(controllers)
+        if not args.no_search_index:
+            index_file = OUTPUT_PATH / f"{args.output}.search.json"
+            with open(index_file, "w", encoding="utf-8") as f:
+                json.dump(index_data, f, separators=(",", ":"))
+            written.append(index_file)
+            print(f"Search index: {index_file}")
+        if args.benchmark_search:
+            benchmark_search(controllers, SearchIndex(index_data))
+    
+    if args.compress:
+        if brotli is None:
+            print("brotli is not installed; skipping .br variants (pip install brotli)")
+        manifest = compress_artifacts(written)
+        manifest_file = OUTPUT_PATH / f"{args.output}.manifest.json"
+        with open(manifest_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        print(f"Compression manifest: {manifest_file}")
+    else:
+        remove_compressed_artifacts(written, args.output)
+    
     print("\n✅ API documentation generated successfully!")
     return 0
 